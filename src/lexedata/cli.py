@@ -41,7 +41,15 @@ class Exit(IntEnum):
 def tq(iter, task, logger=logger, total: t.Optional[t.Union[int, float]] = None):
     if logger.getEffectiveLevel() <= logging.INFO:
         logger.info(task)
-        return tqdm.tqdm(iter, total=total)
+        if total is None:
+            try:
+                total = len(iter)
+            except TypeError:
+                return tqdm.tqdm(iter, mininterval=0.5)
+        # Redraw the bar at most ~200 times, however long the iteration is.
+        return tqdm.tqdm(
+            iter, total=total, miniters=max(1, int(total) // 200), mininterval=0.5
+        )
     else:
         return iter
 
@@ -118,17 +126,15 @@ class SetOrFromFile(argparse.Action):
         if len(values) == 1:
             path = Path(values[0])
             if path.exists():
-                values = set()
-                for c, concept in enumerate(csv.reader(path.open(encoding="utf-8"))):
-                    first_column = concept[0]
-                    if c == 0:
-                        # header row
+                with path.open(encoding="utf-8") as file:
+                    reader = csv.reader(file)
+                    header = next(reader, None)
+                    if header is not None:
                         logger.info(
                             "Reading concept IDs from column with header %s",
-                            first_column,
+                            header[0],
                         )
-                    else:
-                        values.add(first_column)
+                    values = {row[0] for row in reader}
                 setattr(namespace, self.dest, values)
                 return
             logger.debug(
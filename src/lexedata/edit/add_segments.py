@@ -249,8 +249,8 @@ def add_segments_to_dataset(
     c_f_id = dataset["FormTable", "id"].name
     c_f_lan = dataset["FormTable", "languageReference"].name
     c_f_form = dataset["FormTable", "form"].name
-    # report = t.Dict[str, t.Dict[str, t.Dict[str, str]]] = {}
-    report = {f[c_f_lan]: SegmentReport() for f in dataset["FormTable"]}
+    # One report per language, created when the language is first segmented
+    report: t.DefaultDict[str, SegmentReport] = defaultdict(SegmentReport)
     for r, row in cli.tq(
         enumerate(dataset["FormTable"], 1),
         task="Writing forms with segments to dataset",
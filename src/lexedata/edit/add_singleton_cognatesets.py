@@ -100,6 +100,8 @@ def create_singletons(
             "No Status_Column in CognatesetTable. I will proceed without. Run `lexedata.edit.add_status_column`` in default mode or with table-names CognatesetTable to add a Status_Column."
         )
 
+    # Read the CognateTable only once, also when cognate sets are derived from it.
+    all_judgements = list(dataset["CognateTable"])
     try:
         c_s_id = dataset["CognatesetTable", "id"].name
         all_cognatesets = {s[c_s_id]: s for s in dataset["CognatesetTable"]}
@@ -108,14 +110,13 @@ def create_singletons(
         c_s_name = "name"
         all_cognatesets = {
             id: types.Judgement({"id": id, "name": id})
-            for id in {j[c_j_cogset] for j in dataset["CognateTable"]}
+            for id in {j[c_j_cogset] for j in all_judgements}
         }
     try:
         c_s_name = dataset["CognatesetTable", "name"].name
     except KeyError:
         c_s_name = c_s_id
 
-    all_judgements = list(dataset["CognateTable"])
     if by_segment:
         judgements = segment_to_cognateset(dataset, types.WorldSet(), logger)
         forms_and_segments = uncoded_segments(judgements, logger)
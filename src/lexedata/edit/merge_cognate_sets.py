@@ -8,7 +8,6 @@ What other columns give warnings, what other columns give errors?
 *Optionally*, merge cognate sets that get merged by this procedure.
 """
 
-import re
 import argparse
 import typing as t
 from collections import defaultdict
@@ -18,6 +17,7 @@ import pycldf
 
 from lexedata import cli, types, util
 from lexedata.edit.merge_homophones import (
+    REPORT_ENTRY,
     Merger,
     Skip,
     all_mergers,
@@ -48,7 +48,7 @@ def parse_cognatesets_report(
     next_group = []
     for line in report:
         line = line.rstrip()
-        match = re.match(r"\s+?([\w-]+?)( \(.*\))?$", line)
+        match = REPORT_ENTRY.match(line)
         if match:
             next_group.append(match.group(1))
         else:
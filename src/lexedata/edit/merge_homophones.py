@@ -31,6 +31,11 @@ Merger = t.Callable[[t.Sequence[C], MaybeRow], t.Optional[C]]
 # the separator.
 SEPARATOR = "; "
 
+# An indented report line listing one ID, optionally followed by a
+# parenthesized comment. Written without lazy quantifiers, so it never
+# backtracks over long non-matching lines.
+REPORT_ENTRY = re.compile(r"\s+([\w-]+)( \(.*\))?$")
+
 
 def isiterable(obj: object) -> bool:
     """Test whether object is iterable, BUT NOT A STRING.
@@ -554,7 +559,7 @@ def parse_homophones_report(
     )
     target_id: t.Optional[types.Form_ID] = None
     for line in report:
-        match = re.match(r"\s+?([\w-]+?)( \(.*\))?$", line)
+        match = REPORT_ENTRY.match(line)
         if match:
             id = match.group(1)
             if target_id is None:
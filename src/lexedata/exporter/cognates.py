@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 import abc
+import collections
+import operator
 import re
 import typing as t
 import urllib.parse
@@ -7,6 +9,7 @@ from pathlib import Path
 
 import openpyxl as op
 import pycldf
+from openpyxl.cell import WriteOnlyCell
 
 from lexedata import cli, types, util
 from lexedata.edit.add_singleton_cognatesets import create_singletons
@@ -14,6 +17,9 @@ from lexedata.util import parse_segment_slices
 
 WARNING = "\u26A0"
 
+# Signature that lexedata leaves in comments, stripped when writing them back
+SIGNATURE = re.compile(rf"-?{re.escape(__package__)}")
+
 # ----------- Remark: Indices in excel are always 1-based. -----------
 
 # TODO: Make comments on Languages, Cognatesets, and Judgements appear as notes
@@ -28,6 +34,14 @@ class BaseExcelWriter:
 
     row_table: str
     header: t.List[t.Tuple[str, str]]
+    # The FormTable properties that the writer reads from each form
+    form_properties: t.Sequence[str] = (
+        "id",
+        "languageReference",
+        "parameterReference",
+        "form",
+        "segments",
+    )
 
     def __init__(
         self,
@@ -41,14 +55,63 @@ class BaseExcelWriter:
             for c in dataset[self.row_table].tableSchema.columns
             if c.separator
         }
+        # Resolve the separator of each row header column once, instead of
+        # once per row.
+        self.row_columns: t.List[t.Tuple[int, str, str, t.Optional[str]]] = [
+            (col, db_name, header, self.separators.get(db_name))
+            for col, (db_name, header) in enumerate(self.header, 1)
+        ]
 
         self.URL_BASE = database_url
 
-        self.wb = op.Workbook()
-        self.ws: op.worksheet.worksheet.Worksheet = self.wb.active
+        self.wb, self.ws = self._new_workbook()
+        # Cells of the rows that are not yet written, keyed by (row, column)
+        self.buffer: t.Dict[t.Tuple[int, int], WriteOnlyCell] = {}
 
         self.logger = logger
 
+    def _new_workbook(self) -> t.Tuple[op.Workbook, t.Any]:
+        """Create the workbook and the worksheet to write to.
+
+        The workbook is only ever appended to, so we can stream it out row by
+        row instead of keeping every cell object in memory.
+
+        """
+        wb = op.Workbook(write_only=True)
+        return wb, wb.create_sheet()
+
+    def _write_row(self, cells: t.Mapping[int, t.Any]) -> None:
+        """Append one row, given as a mapping from 1-based columns to cells.
+
+        Rows are written strictly in order, so this is the only place where
+        the worksheet is touched after the workbook is created.
+
+        """
+        self.ws.append(
+            [cells.get(column) for column in range(1, max(cells, default=0) + 1)]
+        )
+
+    def cell(self, row: int, column: int, value: t.Any = None) -> WriteOnlyCell:
+        """Create a cell to be written at the given row and column.
+
+        The worksheet is write-only, so unlike `Worksheet.cell`, this does not
+        give access to cells already written. The cell is kept in a buffer
+        until `flush_rows` writes out its row.
+
+        """
+        cell = WriteOnlyCell(self.ws, value=value)
+        self.buffer[row, column] = cell
+        return cell
+
+    def flush_rows(self, start: int, end: int) -> None:
+        """Write the buffered rows from start (inclusive) to end (exclusive)."""
+        buffered = t.DefaultDict[int, t.Dict[int, WriteOnlyCell]](dict)
+        for (row, column), cell in self.buffer.items():
+            buffered[row][column] = cell
+        self.buffer = {}
+        for row in range(start, end):
+            self._write_row(buffered.get(row, {}))
+
     def create_excel(
         self,
         rows: t.Iterable[types.RowObject],
@@ -68,19 +131,15 @@ class BaseExcelWriter:
 
         """
         # Define the columns, i.e. languages and write to excel
-        self.lan_dict: t.Dict[str, int] = {}
         excel_header = [name for cldf, name in self.header]
-
-        for col, lan in cli.tq(
-            enumerate(languages, len(excel_header) + 1),
-            task="Writing languages to excel header",
-            total=len(languages),
-        ):
-            # TODO: This should be based on the foreign key relation of
-            # languageReference
-            self.lan_dict[lan["id"]] = col
-            excel_header.append(lan.get("name", lan["id"]))
-        self.ws.append(excel_header)
+        languages = list(languages)
+        # TODO: This should be based on the foreign key relation of
+        # languageReference
+        self.lan_dict: t.Dict[str, int] = {
+            lan["id"]: col for col, lan in enumerate(languages, len(excel_header) + 1)
+        }
+        excel_header.extend(lan.get("name", lan["id"]) for lan in languages)
+        self._write_row(dict(enumerate(excel_header, 1)))
 
         # Again, row_index 2 is indeed row 2, row 1 is header
         row_index = 1 + 1
@@ -96,15 +155,12 @@ class BaseExcelWriter:
         ):
             # possibly a row can appear without any forms. Unlikely, but just
             # ignore those.
-            if row["id"] not in forms_by_row:
+            row_forms = forms_by_row.get(row["id"])
+            if row_forms is None:
                 continue
             # write all forms of this cognateset to excel
             new_row_index = self.create_formcells(
-                [
-                    (forms[f], m)
-                    for f, metadata in forms_by_row[row["id"]].items()
-                    for m in metadata
-                ],
+                [(forms[f], m) for f, metadata in row_forms.items() for m in metadata],
                 row_index,
             )
             # write rows for cognatesets, now that we know how many rows there
@@ -113,6 +169,7 @@ class BaseExcelWriter:
             for r in range(row_index, new_row_index):
                 self.write_row_header(row, r)
 
+            self.flush_rows(row_index, new_row_index)
             row_index = new_row_index
 
     def create_formcells(
@@ -132,19 +189,17 @@ class BaseExcelWriter:
         """
         # Read the forms from the database and group them by language
         forms = t.DefaultDict[int, t.List[types.Form]](list)
+        lan_dict = self.lan_dict
         for form, metadata in row_forms:
-            forms[self.lan_dict[form["languageReference"]]].append((form, metadata))
-
-        if not forms:
-            return row_index + 1
+            forms[lan_dict[form["languageReference"]]].append((form, metadata))
 
-        # maximum of rows to be added
-        maximum_size = max([len(c) for c in forms.values()])
+        create_formcell = self.create_formcell
         for column, cells in forms.items():
             for row, entry in enumerate(cells, row_index):
-                self.create_formcell(entry, column, row)
-        # increase row_index and return
-        row_index += maximum_size
+                create_formcell(entry, column, row)
+        # increase row_index by the maximum of rows added, but by at least one
+        # row even if there are no forms, and return
+        row_index += max(map(len, forms.values()), default=0) or 1
 
         return row_index
 
@@ -158,13 +213,27 @@ class BaseExcelWriter:
         """
         form, metadata = form
         cell_value = self.form_to_cell_value(form)
-        form_cell = self.ws.cell(row=row, column=column, value=cell_value)
+        form_cell = self.cell(row=row, column=column, value=cell_value)
         comment = metadata.get("comment")
         if comment:
             form_cell.comment = op.comments.Comment(comment, __package__)
         if self.URL_BASE:
-            link = self.URL_BASE.format(urllib.parse.quote(form["id"]))
-            form_cell.hyperlink = link
+            form_cell.hyperlink = self.form_url(form["id"])
+
+    def form_url(self, form_id: types.Form_ID) -> str:
+        """Build the URL pointing to a form from the database URL template.
+
+        >>> ds = util.fs.new_wordlist(FormTable=[], CognatesetTable=[], CognateTable=[])
+        >>> E = ExcelWriter(dataset=ds, database_url="https://example.org/{:}")
+        >>> E.form_url("form_1")
+        'https://example.org/form_1'
+        >>> E.form_url("form 1")
+        'https://example.org/form%201'
+        """
+        # IDs in the recommended format are URL-safe already.
+        if not util.ID_FORMAT.fullmatch(form_id):
+            form_id = urllib.parse.quote(form_id)
+        return self.URL_BASE.format(form_id)
 
     @abc.abstractmethod
     def form_to_cell_value(self, form: types.Form):
@@ -191,9 +260,9 @@ class BaseExcelWriter:
     def write_row_header(self, row_object: types.RowObject, row_index: int):
         """Write a row header
 
-        Write into the first few columns of the row `row_index` of self.ws the
-        metadata of a row, eg. concept ID and gloss or cognateset ID,
-        cognateset name and status.
+        Write into the first few columns of the row `row_index` (using
+        self.cell, which buffers the row for self.ws) the metadata of a row,
+        eg. concept ID and gloss or cognateset ID, cognateset name and status.
 
         """
 
@@ -249,7 +318,8 @@ class ExcelWriter(BaseExcelWriter):
                 )
 
     def write_row_header(self, cogset, row_number: int):
-        for col, (db_name, header) in enumerate(self.header, 1):
+        comment = cogset.get("comment")
+        for col, db_name, header, separator in self.row_columns:
             # db_name is '' when add_central_concepts is activated
             # and there is no concept column in cognateset table
             # else read value from cognateset table
@@ -260,19 +330,15 @@ class ExcelWriter(BaseExcelWriter):
                 )
             if cogset[db_name] is None:
                 value = ""
+            elif separator is None:
+                value = cogset.get(db_name, "")
             else:
-                try:
-                    value = self.separators[db_name].join(
-                        [str(v) for v in cogset[db_name]]
-                    )
-                except KeyError:
-                    # No separator
-                    value = cogset.get(db_name, "")
-            cell = self.ws.cell(row=row_number, column=col, value=value)
+                value = separator.join([str(v) for v in cogset[db_name]])
+            cell = self.cell(row=row_number, column=col, value=value)
             # Transfer the cognateset comment to the first Excel cell.
-            if col == 1 and cogset.get("comment"):
+            if col == 1 and comment:
                 cell.comment = op.comments.Comment(
-                    re.sub(f"-?{__package__}", "", cogset["comment"]).strip(),
+                    SIGNATURE.sub("", comment).strip(),
                     "lexedata.exporter",
                 )
 
@@ -340,22 +406,24 @@ class ExcelWriter(BaseExcelWriter):
         if not segments:
             transcription = form["form"]
         else:
-            transcription = ""
             # TODO: use CLDF property instead of column name
-            included_segments: t.Iterable[int]
+            # included_segments[i] is 1 if segment i is in the segment slice
+            included_segments = bytearray(len(segments))
             try:
-                included_segments = set(
-                    parse_segment_slices(form["segmentSlice"], enforce_ordered=True)
-                )
+                for i in parse_segment_slices(
+                    form["segmentSlice"], enforce_ordered=True
+                ):
+                    if 0 <= i < len(segments):
+                        included_segments[i] = 1
             except TypeError:
                 self.logger.warning(
                     "In judgement %s, for form %s, there was no segment slice. I will use the whole form.",
                     form["cognateReference"],
                     form["id"],
                 )
-                included_segments = range(len(form["segments"]))
+                included_segments = bytearray(b"\x01") * len(segments)
             except KeyError:
-                included_segments = range(len(form["segments"]))
+                included_segments = bytearray(b"\x01") * len(segments)
             except ValueError:
                 # What if segments overlap or cross? Overlap shouldn't happen,
                 # but we don't check here. Crossing might happen, but this
@@ -369,41 +437,33 @@ class ExcelWriter(BaseExcelWriter):
                     form["id"],
                     ",".join(form["segmentSlice"]),
                 )
-                included_segments = range(len(form["segments"]))
+                included_segments = bytearray(b"\x01") * len(segments)
 
+            parts: t.List[str] = []
             included = False
-            for i, s in enumerate(segments):
-                if included and i not in included_segments:
-                    transcription += " }" + s
+            for s, in_slice in zip(segments, included_segments):
+                if included and not in_slice:
+                    parts.append(" }" + s)
                     included = False
-                elif not included and i in included_segments:
-                    transcription += "{ " + s
+                elif not included and in_slice:
+                    parts.append("{ " + s)
                     included = True
-                elif i in included_segments:
-                    transcription += " " + s
+                elif in_slice:
+                    parts.append(" " + s)
                 else:
-                    transcription += s
+                    parts.append(s)
             if included:
-                transcription += " }"
-
-            transcription = transcription.strip()
-        translations = []
+                parts.append(" }")
 
-        suffix = ""
-        try:
-            if form.get("formComment"):
-                suffix = f" {WARNING:}"
-        except (KeyError):
-            pass
+            transcription = "".join(parts).strip()
+        suffix = f" {WARNING:}" if form.get("formComment") else ""
 
         # corresponding concepts
         # (multiple concepts) and others (single concept)
-        if isinstance(form["parameterReference"], list):
-            for f in form["parameterReference"]:
-                translations.append(f)
-        else:
-            translations.append(form["parameterReference"])
-        return "{:} ‘{:}’{:}".format(transcription, ", ".join(translations), suffix)
+        translations = form["parameterReference"]
+        if isinstance(translations, list):
+            translations = ", ".join(translations)
+        return f"{transcription:} ‘{translations:}’{suffix:}"
 
 
 def properties_as_key(data, columns):
@@ -428,15 +488,33 @@ def sort_cognatesets(
     # happen, the cognatesets are globally sorted by the specified column
     # and within one group by size.
     if size:
-        cogsets.sort(
-            key=lambda x: len(
-                [j for j in judgements if j["cognatesetReference"] == x["id"]]
-            ),
-            reverse=True,
-        )
+        sizes = collections.Counter(j["cognatesetReference"] for j in judgements)
+        cogsets.sort(key=lambda x: sizes[x["id"]], reverse=True)
 
     if sort_column:
-        cogsets.sort(key=lambda c: c[sort_column])
+        cogsets.sort(key=operator.itemgetter(sort_column))
+
+
+def cache_forms(
+    dataset: pycldf.Dataset, properties: t.Iterable[str]
+) -> t.Mapping[types.Form_ID, types.Form]:
+    """Load the FormTable into memory, keeping only the given properties.
+
+    Properties that the FormTable does not have are skipped.
+
+    >>> ds = util.fs.new_wordlist(FormTable=[
+    ...   {"ID": "f1", "Language_ID": "l", "Parameter_ID": "c", "Form": "f"}])
+    >>> cache_forms(ds, ["id", "form", "segments"])
+    {'f1': {'id': 'f1', 'form': 'f', 'segments': []}}
+    >>> cache_forms(ds, ["id", "orthographic"])
+    {'f1': {'id': 'f1'}}
+    """
+    columns = {
+        property: dataset["FormTable", property].name
+        for property in properties
+        if ("FormTable", property) in dataset
+    }
+    return util.cache_table(dataset, columns=columns)
 
 
 def parser():
@@ -521,7 +599,8 @@ if __name__ == "__main__":  # pragma: no cover
 
     dataset = pycldf.Wordlist.from_metadata(args.metadata)
     try:
-        cogsets = list(dataset["CognatesetTable"])
+        # Only check that the table exists, the cognate sets are read below.
+        dataset["CognatesetTable"]
     except (KeyError):
         cli.Exit.INVALID_DATASET(
             "Dataset has no explicit CognatesetTable. Add one using `lexedata.edit.add_table CognatesetTable`."
@@ -565,7 +644,7 @@ if __name__ == "__main__":  # pragma: no cover
         )
         languages.sort(key=lambda x: x[c_sort], reverse=False)
 
-    forms = util.cache_table(dataset)
+    forms = cache_forms(dataset, E.form_properties)
 
     E.create_excel(
         size_sort=args.size_sort,
@@ -1,20 +1,19 @@
 # -*- coding: utf-8 -*-
-import re
 import typing as t
-import urllib
 from pathlib import Path
 
 import openpyxl as op
 import pycldf
 
 from lexedata import cli, types, util
-from lexedata.exporter.cognates import BaseExcelWriter
+from lexedata.exporter.cognates import SIGNATURE, BaseExcelWriter, cache_forms
 
 
 class MatrixExcelWriter(BaseExcelWriter):
     """Class logic for Excel matrix export."""
 
     row_table = "ParameterTable"
+    form_properties = BaseExcelWriter.form_properties + ("comment",)
 
     def __init__(
         self,
@@ -28,30 +27,30 @@ class MatrixExcelWriter(BaseExcelWriter):
         self.header = [("id", "ID")]
         self.header.append(("name", "Name"))
 
-        try:
-            dataset["ParameterTable", "concepticonReference"].name
+        if ("ParameterTable", "concepticonReference") in dataset:
             self.header.append(("concepticonReference", "Concepticon"))
-        except KeyError:
-            pass
 
     def form_to_cell_value(self, form: types.Form) -> str:
         # TODO: Placeholder, use proper structure here.
         return form["form"]
 
     def write_row_header(self, cogset, row):
-        for col, (db_name, header) in enumerate(self.header, 1):
+        comment = cogset.get("comment")
+        for col, db_name, header, separator in self.row_columns:
             if db_name == "":
                 continue
-            try:
-                value = self.separators[db_name].join([str(v) for v in cogset[db_name]])
-            except KeyError:
-                # No separator
+            if separator is None:
                 value = cogset.get(db_name, "")
-            cell = self.ws.cell(row=row, column=col, value=value)
+            else:
+                try:
+                    value = separator.join([str(v) for v in cogset[db_name]])
+                except KeyError:
+                    value = ""
+            cell = self.cell(row=row, column=col, value=value)
             # Transfer the cognateset comment to the first Excel cell.
-            if col == 1 and cogset.get("comment"):
+            if col == 1 and comment:
                 cell.comment = op.comments.Comment(
-                    re.sub(f"-?{__package__}", "", cogset["comment"] or "").strip(),
+                    SIGNATURE.sub("", comment).strip(),
                     "lexedata.exporter",
                 )
 
@@ -65,13 +64,12 @@ class MatrixExcelWriter(BaseExcelWriter):
         """
         form, metadata = form
         cell_value = self.form_to_cell_value(form)
-        form_cell = self.ws.cell(row=row, column=column, value=cell_value)
+        form_cell = self.cell(row=row, column=column, value=cell_value)
         comment = form.pop("comment", None)
         if comment:
             form_cell.comment = op.comments.Comment(comment, __package__)
         if self.URL_BASE:
-            link = self.URL_BASE.format(urllib.parse.quote(form["id"]))
-            form_cell.hyperlink = link
+            form_cell.hyperlink = self.form_url(form["id"])
 
 
 if __name__ == "__main__":
@@ -110,7 +108,7 @@ if __name__ == "__main__":
         database_url=args.url_template,
         logger=logger,
     )
-    forms = util.cache_table(dataset)
+    forms = cache_forms(dataset, E.form_properties)
     languages = sorted(
         util.cache_table(dataset, "LanguageTable").values(), key=lambda x: x["name"]
     )
@@ -87,7 +87,6 @@ def import_interleaved(
                 )
 
             while i < len(f):
-                match = comma_or_semicolon.match(f[i:])
                 if f[i] == "(":
                     bracket_level += 1
                     i += 1
@@ -99,10 +98,10 @@ def import_interleaved(
                 elif bracket_level:
                     i += 1
                     continue
-                elif match:
+                match = comma_or_semicolon.match(f, i)
+                if match:
                     forms.append(f[:i].strip())
-                    i += match.span()[1]
-                    f = f[i:]
+                    f = f[match.end() :]
                     i = 0
                 else:
                     i += 1
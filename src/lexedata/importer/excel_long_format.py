@@ -60,7 +60,9 @@ def import_data_from_sheet(
     concept_column: t.Tuple[str, str] = ("Concept_ID", "Concept_ID"),
     skip_if_questionmark: t.Container[str] = set(),
 ) -> t.Iterable[Form]:
-    row_iter = sheet.iter_rows()
+    # Ask for the full header width explicitly, so that rows with missing
+    # trailing cells still come back as complete rows of (empty) cells.
+    row_iter = sheet.iter_rows(max_col=len(sheet_header))
 
     # TODO?: compare header of this sheet to format of given dataset process
     # row. Maybe unnecessary. In any case, do not complain about the unused
@@ -146,6 +148,10 @@ def read_single_excel_sheet(
                 "Matching by concept enabled: To find potential polysemies, run lexedata.report.list_homophones."
             )
 
+    if hasattr(sheet, "reset_dimensions"):
+        # Read-only worksheets stop at the size recorded in the file, which
+        # some tools get wrong, so make them read all the data there is.
+        sheet.reset_dimensions()
     sheet_header = get_headers_from_excel(sheet)
     form_header = list(dataset["FormTable"].tableSchema.columndict.keys())
 
@@ -224,6 +230,7 @@ def read_single_excel_sheet(
             skip_if_questionmark={c_f_form},
         ),
         task=f"Parsing cells of sheet {sheet.title}",
+        # Unknown for read-only worksheets, whose dimensions were reset
         total=sheet.max_row,
     ):
         if language_name_column:
@@ -411,6 +418,11 @@ def add_single_languages(
     return report
 
 
+def load_workbook_read_only(filename) -> openpyxl.Workbook:
+    """Open an Excel file for streaming its cells, without loading it whole."""
+    return openpyxl.load_workbook(filename, read_only=True)
+
+
 def parser():
     parser = cli.parser(
         __package__ + "." + Path(__file__).stem,
@@ -418,7 +430,7 @@ def parser():
     )
     parser.add_argument(
         "excel",
-        type=openpyxl.load_workbook,
+        type=load_workbook_read_only,
         help="The Excel file to parse",
         metavar="EXCEL",
     )
@@ -527,6 +539,8 @@ if __name__ == "__main__":  # pragma: no cover
         logger=logger,
         missing_concepts=missing_concepts,
     )
+    # Read-only workbooks keep their file open until closed.
+    args.excel.close()
     if args.report:
         report_data = [report(language) for language, report in report.items()]
         print(
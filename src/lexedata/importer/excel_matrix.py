@@ -285,9 +285,8 @@ class ExcelParser(t.Generic[R]):
         c_name = self.db.dataset[self.row_type.__table__, "name"].name
         data = [clean_cell_value(cell) for cell in row[: self.left - 1]]
         properties = dict(zip(self.row_header, data))
-        # delete all possible None entries coming from row_header
-        while None in properties.keys():
-            del properties[None]
+        # delete the None entry coming from unnamed row_header columns
+        properties.pop(None, None)
 
         # fetch cell comment
         comment = get_cell_comment(row[0])
@@ -539,9 +538,8 @@ class ExcelCognateParser(ExcelParser[CogSet]):
         c_name = self.db.dataset[self.row_type.__table__, "name"].name
         data = [clean_cell_value(cell) for cell in row[: self.left - 1]]
         properties = dict(zip(self.row_header, data))
-        # delete all possible None entries coming from row_header
-        while None in properties.keys():
-            del properties[None]
+        # delete the None entry coming from unnamed row_header columns
+        properties.pop(None, None)
 
         # fetch cell comment
         comment = get_cell_comment(row[0])
@@ -634,10 +632,19 @@ def excel_parser_from_dialect(
         Row = Concept
         Parser = ExcelParser
     top = len(dialect.lang_cell_regexes) + 1
+    # Compile the header regexes once, instead of once per cell
+    lang_cell_regexes = [re.compile(r, re.DOTALL) for r in dialect.lang_cell_regexes]
+    lang_comment_regexes = [
+        re.compile(r, re.DOTALL) for r in dialect.lang_comment_regexes
+    ]
+    row_cell_regexes = [re.compile(r, re.DOTALL) for r in dialect.row_cell_regexes]
+    row_comment_regexes = [
+        re.compile(r, re.DOTALL) for r in dialect.row_comment_regexes
+    ]
     # prepare cellparser
     row_header = []
-    for row_regex in dialect.row_cell_regexes:
-        match = re.fullmatch(row_regex, "", re.DOTALL)
+    for row_regex in row_cell_regexes:
+        match = row_regex.fullmatch("")
         # TODO: when trying to raise a ValueError due to row_regexes not matching with the cell content,
         # I modify one of the regexes so that it does not match with any content of the cell.
         # Thus it doesn't match with '' either. The match object is None, and an AttributeError is raised.
@@ -683,14 +690,14 @@ def excel_parser_from_dialect(
             """
             d: t.Dict[str, str] = {}
             for cell, cell_regex, comment_regex in zip(
-                column, dialect.lang_cell_regexes, dialect.lang_comment_regexes
+                column, lang_cell_regexes, lang_comment_regexes
             ):
                 if cell.value:
-                    match = re.fullmatch(cell_regex, cell.value.strip(), re.DOTALL)
+                    match = cell_regex.fullmatch(cell.value.strip())
                     if match is None:
                         raise ValueError(
                             f"In cell {cell.coordinate}: Expected to encounter match "
-                            f"for {cell_regex}, but found {cell.value}"
+                            f"for {cell_regex.pattern}, but found {cell.value}"
                         )
                     for k, v in match.groupdict().items():
                         if k in d:
@@ -698,11 +705,11 @@ def excel_parser_from_dialect(
                         else:
                             d[k] = v
                 if cell.comment:
-                    match = re.fullmatch(comment_regex, cell.comment.content, re.DOTALL)
+                    match = comment_regex.fullmatch(cell.comment.content)
                     if match is None:
                         raise ValueError(
                             f"In cell {cell.coordinate}: Expected to encounter match "
-                            f"for {comment_regex}, but found {cell.comment.content}"
+                            f"for {comment_regex.pattern}, but found {cell.comment.content}"
                         )
                     for k, v in match.groupdict().items():
                         if k in d:
@@ -726,14 +733,14 @@ def excel_parser_from_dialect(
             """
             d: t.Dict[str, str] = {}
             for cell, cell_regex, comment_regex in zip(
-                row, dialect.row_cell_regexes, dialect.row_comment_regexes
+                row, row_cell_regexes, row_comment_regexes
             ):
                 if cell.value:
-                    match = re.fullmatch(cell_regex, cell.value.strip(), re.DOTALL)
+                    match = cell_regex.fullmatch(cell.value.strip())
                     if match is None:
                         raise ValueError(
                             f"In cell {cell.coordinate}: Expected to encounter match "
-                            f"for {cell_regex}, but found {cell.value}"
+                            f"for {cell_regex.pattern}, but found {cell.value}"
                         )
                     for k, v in match.groupdict().items():
                         if k in d:
@@ -741,11 +748,11 @@ def excel_parser_from_dialect(
                         else:
                             d[k] = v
                 if cell.comment:
-                    match = re.fullmatch(comment_regex, cell.comment.content, re.DOTALL)
+                    match = comment_regex.fullmatch(cell.comment.content)
                     if match is None:
                         raise ValueError(
                             f"In cell {cell.coordinate}: Expected to encounter match for "
-                            f"{comment_regex}, but found {cell.comment.content}"
+                            f"{comment_regex.pattern}, but found {cell.comment.content}"
                         )
                     for k, v in match.groupdict().items():
                         if k in d:
@@ -23,6 +23,17 @@ from lexedata.report.judgements import check_cognate_table
 
 # from clldutils.misc import log_or_raise
 
+# ID column formats known to be subsets of [a-zA-Z0-9_-]+
+ACCEPTED_ID_FORMATS = frozenset(
+    {
+        "[a-zA-Z0-9_\\-]+",
+        "[a-zA-Z0-9_-]+",
+        "[A-Za-z0-9_-]+",
+        "[a-zA-Z0-9\\-_]+",
+        "[a-z0-9_]+",
+    }
+)
+
 
 def log_or_raise(message, log: cli.logging.Logger = cli.logger):
     log.warning(message)
@@ -60,13 +71,7 @@ def check_id_format(dataset: pycldf.Dataset, logger: cli.logging.Logger = cli.lo
                     logger,
                 )
             else:
-                if datatype.format not in {
-                    "[a-zA-Z0-9_\\-]+",
-                    "[a-zA-Z0-9_-]+",
-                    "[A-Za-z0-9_-]+",
-                    "[a-zA-Z0-9\\-_]+",
-                    "[a-z0-9_]+",
-                }:
+                if datatype.format not in ACCEPTED_ID_FORMATS:
                     log_or_raise(
                         f"Table {table.url} has a string ID column {id_column.name} with format {datatype.format}. "
                         f"I am too dumb to check whether that's a subset of [a-zA-Z0-9_-]+ (which is fine) "
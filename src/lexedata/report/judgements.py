@@ -8,11 +8,13 @@ from pathlib import Path
 import pycldf
 
 from lexedata import cli
-from lexedata.util import cache_table, parse_segment_slices
+from lexedata.util import parse_segment_slices
 
 
-def log_or_raise(message, logger=cli.logger):
-    logger.warning(message)
+def log_or_raise(message, *args, logger=cli.logger):
+    # Pass the arguments on, so that the message is only formatted if it is
+    # actually emitted.
+    logger.warning(message, *args)
 
 
 def check_cognate_table(
@@ -63,25 +65,27 @@ def check_cognate_table(
     # over the implicit semantics of a `#xxxReference` column pointing to an
     # `#id` column, so we need to find forms by the stated foreign key
     # relationship.
-    for foreign_key in cognatetable.tableSchema.foreignKeys:
-        if foreign_key.columnReference == [c_form]:
-            referenced_table = str(foreign_key.reference.resource)
-            # A multi-column column reference for a single-column foreign key
-            # makes no sense, so use tuple unpacking to extract the only
-            # element from that list.
-            (referenced_column,) = foreign_key.reference.columnReference
-            if (
-                not dataset[referenced_table].common_props["dc:conformsTo"]
-                == "http://cldf.clld.org/v1.0/terms.rdf#FormTable"
-            ):
-                log_or_raise(
-                    "CognateTable #formReference does not reference a FormTable.",
-                )
-            break
-    else:
+    foreign_keys = {
+        tuple(foreign_key.columnReference): foreign_key
+        for foreign_key in cognatetable.tableSchema.foreignKeys
+    }
+    try:
+        foreign_key = foreign_keys[(c_form,)]
+    except KeyError:
         log_or_raise("CognateTable #formReference must be a foreign key.")
         # All further checks don't make sense, return early.
         return False
+    referenced_table = str(foreign_key.reference.resource)
+    # A multi-column column reference for a single-column foreign key makes no
+    # sense, so use tuple unpacking to extract the only element from that list.
+    (referenced_column,) = foreign_key.reference.columnReference
+    if (
+        not dataset[referenced_table].common_props["dc:conformsTo"]
+        == "http://cldf.clld.org/v1.0/terms.rdf#FormTable"
+    ):
+        log_or_raise(
+            "CognateTable #formReference does not reference a FormTable.",
+        )
 
     try:
         c_sslice = dataset["CognateTable", "segmentSlice"].name
@@ -116,53 +120,64 @@ def check_cognate_table(
 
     # Check whether each row is valid.
     all_judgements_okay = True
-    forms = cache_table(
-        dataset,
-        columns={"segments": dataset[referenced_table, "segments"].name},
-        table=referenced_table,
-        index_column=referenced_column,
-        filter=form_given,
-    )
-    missing_forms = cache_table(
-        dataset,
-        columns={},
-        table=referenced_table,
-        index_column=referenced_column,
-        filter=lambda row: not form_given(row),
-    )
-    cognateset_alignment_lengths: t.DefaultDict[t.Any, t.Set[int]] = t.DefaultDict(set)
+    # Map each form to its segments directly, and collect NA forms in the
+    # same pass over the table.
+    c_f_segments = dataset[referenced_table, "segments"].name
+    forms: t.Dict[t.Hashable, t.Sequence[str]] = {}
+    missing_forms: t.Set[t.Hashable] = set()
+    for row in cli.tq(
+        dataset[referenced_table],
+        task=f"Caching table {referenced_table}",
+        total=dataset[referenced_table].common_props.get("dc:extent"),
+    ):
+        if form_given(row):
+            forms[row[referenced_column]] = row[c_f_segments]
+        else:
+            missing_forms.add(row[referenced_column])
+    parsed_slices: t.Dict[t.Tuple[str, ...], t.List[int]] = {}
+    # The length of the first alignment seen for each cognate set
+    cognateset_alignment_lengths: t.Dict[t.Any, int] = {}
 
     for f, j, judgement in dataset["CognateTable"].iterdicts(with_metadata=True):
+        form_id = judgement[c_form]
         try:
-            form_segments = forms[judgement[c_form]]["segments"]
+            form_segments = forms[form_id]
         except KeyError:
-            if judgement[c_form] in missing_forms:
+            if form_id in missing_forms:
                 log_or_raise(
-                    "In {}, row {}: NA form {} was judged to be in cognate set.".format(
-                        f, j, judgement[c_form]
-                    ),
+                    "In %s, row %s: NA form %s was judged to be in cognate set.",
+                    f,
+                    j,
+                    form_id,
                 )
             # The case of a missing foreign key in general is already handled
             # by the basic CLDF validator.
             continue
 
         if c_sslice is not None:
-            if not judgement[c_sslice]:
-                log_or_raise("In {}, row {}: Empty segment slice".format(f, j))
+            segment_slice = judgement[c_sslice]
+            if not segment_slice:
+                log_or_raise("In %s, row %s: Empty segment slice", f, j)
                 continue
             try:
-                included_segments = list(parse_segment_slices(judgement[c_sslice]))
-                if (
-                    max(included_segments) >= len(form_segments)
-                    or min(included_segments) < 0
-                ):
+                # Slices repeat a lot, so parse each distinct one only once.
+                # The parsed lists are only read below, never modified.
+                slice_key = tuple(segment_slice)
+                try:
+                    included_segments = parsed_slices[slice_key]
+                except KeyError:
+                    included_segments = list(parse_segment_slices(segment_slice))
+                    parsed_slices[slice_key] = included_segments
+                n_segments = len(form_segments)
+                # One pass over the indices, stopping at the first bad one,
+                # instead of separate max() and min() passes.
+                if not all(0 <= i < n_segments for i in included_segments):
                     log_or_raise(
-                        "In {}, row {}: Segment slice {} is invalid for segments {}".format(
-                            f,
-                            j,
-                            judgement[c_sslice],
-                            form_segments,
-                        ),
+                        "In %s, row %s: Segment slice %s is invalid for segments %s",
+                        f,
+                        j,
+                        segment_slice,
+                        form_segments,
                     )
                     all_judgements_okay = False
                     continue
@@ -171,63 +186,74 @@ def check_cognate_table(
                     for s2 in included_segments[1:]:
                         if s2 != s1 + 1:
                             log_or_raise(
-                                "In {}, row {}: Segment slice {} has non-consecutive elements {}, {}".format(
-                                    f,
-                                    j,
-                                    judgement[c_sslice],
-                                    s1,
-                                    s2,
-                                )
+                                "In %s, row %s: Segment slice %s has non-consecutive elements %s, %s",
+                                f,
+                                j,
+                                segment_slice,
+                                s1,
+                                s2,
                             )
                         s1 = s2
             except ValueError:
                 log_or_raise(
-                    "In {}, row {}: Segment slice {} is invalid".format(
-                        f,
-                        j,
-                        judgement[c_sslice],
-                    )
+                    "In %s, row %s: Segment slice %s is invalid", f, j, segment_slice
                 )
                 all_judgements_okay = False
                 continue
         else:
-            included_segments = list(range(len(form_segments)))
+            # Without segment slices, the judgement refers to the whole form.
+            included_segments = None
 
         if c_alignment:
+            alignment = judgement[c_alignment]
+            cognateset = judgement[c_cognateset]
             # Length of alignment should match length of every other alignment in this cognate set.
-            lengths = cognateset_alignment_lengths[judgement[c_cognateset]]
-            alignment_length = len(judgement[c_alignment])
-            if lengths and alignment_length not in lengths:
+            alignment_length = len(alignment)
+            expected_length = cognateset_alignment_lengths.setdefault(
+                cognateset, alignment_length
+            )
+            if alignment_length != expected_length:
                 log_or_raise(
-                    "In {}, row {}: Alignment has length {}, other alignments of cognateset {} have length(s) {}".format(
-                        f, j, alignment_length, judgement[c_cognateset], lengths
-                    ),
+                    "In %s, row %s: Alignment has length %s, other alignments of cognateset %s have length %s",
+                    f,
+                    j,
+                    alignment_length,
+                    cognateset,
+                    expected_length,
                 )
-                lengths.add(alignment_length)
                 all_judgements_okay = False
-            elif not lengths:
-                lengths.add(alignment_length)
 
             # Alignment when gaps are removed should match segments. TODO:
             # Should we permit other gap characters? Where do we know them
             # from? TODO: To be more robust when segments are separated into
             # morphemes, not individual segments, compare alignment and
             # segments space-separated.
-            without_gaps = " ".join(
-                [c or "" for c in judgement[c_alignment] if c != "-"]
-            )
-            actual_segments = " ".join(form_segments[i] for i in included_segments)
-            if without_gaps.strip() != actual_segments.strip():
-                if unicodedata.normalize(
-                    "NFKC", without_gaps.strip()
-                ) == unicodedata.normalize("NFKC", actual_segments.strip()):
+            aligned_segments = [c or "" for c in alignment if c != "-"]
+            if included_segments is None:
+                referenced_segments = form_segments
+            else:
+                referenced_segments = [form_segments[i] for i in included_segments]
+            # Equal token lists are the common case. Only compare the
+            # space-joined strings, which also accept segments split
+            # differently, when they differ.
+            if aligned_segments == referenced_segments:
+                continue
+            without_gaps = " ".join(aligned_segments).strip()
+            actual_segments = " ".join(referenced_segments).strip()
+            if without_gaps != actual_segments:
+                if unicodedata.normalize("NFKC", without_gaps) == unicodedata.normalize(
+                    "NFKC", actual_segments
+                ):
                     comment = " This is down to encoding differences: Their normalized unicode representations are the same. I suggest you run `lexedata.edit.normalize_unicode`."
                 else:
                     comment = ""
                 log_or_raise(
-                    "In {}, row {}: Referenced segments in form resolve to {}, while alignment contains segments {}.{}".format(
-                        f, j, actual_segments, without_gaps, comment
-                    ),
+                    "In %s, row %s: Referenced segments in form resolve to %s, while alignment contains segments %s.%s",
+                    f,
+                    j,
+                    actual_segments,
+                    without_gaps,
+                    comment,
                 )
                 all_judgements_okay = False
 
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import functools
 import re
 import typing as t
 import unicodedata
@@ -43,6 +44,9 @@ def cldf_property(url: t.Optional[csvw.metadata.URITemplate]) -> t.Optional[str]
         return None
 
 
+# Spreadsheets repeat the same source, concept and language strings many
+# times, and transliteration is the expensive part of building their IDs.
+@functools.lru_cache(maxsize=4096)
 def string_to_id(string: str) -> str:
     """Generate a useful id string from the string
 
@@ -69,7 +73,18 @@ def string_to_id(string: str) -> str:
 
 
 def normalize_string(text: str):
-    return unicodedata.normalize("NFC", text.strip())
+    """Strip and NFC-normalize a string.
+
+    Most strings we see are NFC already, and checking that is much cheaper
+    than normalizing them again.
+
+    >>> normalize_string(" a\u0301 ") == "\u00e1"
+    True
+    """
+    text = text.strip()
+    if unicodedata.is_normalized("NFC", text):
+        return text
+    return unicodedata.normalize("NFC", text)
 
 
 def edit_distance(text1: str, text2: str) -> float:
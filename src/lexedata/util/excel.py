@@ -5,7 +5,6 @@
 
 import re
 import typing as t
-import unicodedata
 import datetime
 
 import openpyxl as op
@@ -13,7 +12,9 @@ import pycldf
 
 import lexedata.cli as cli
 from lexedata.types import Form, Judgement
-from lexedata.util import string_to_id
+from lexedata.util import normalize_string, string_to_id
+
+PROCEDURAL_COMMENT = re.compile(r"^[A-Z]{2,}:")
 
 
 def clean_cell_value(cell: op.cell.cell.Cell, logger=cli.logger):
@@ -30,9 +31,10 @@ def clean_cell_value(cell: op.cell.cell.Cell, logger=cli.logger):
         logger.warning(
             "Encountered Date/Time value %s in cell %s.", cell.value, cell.coordinate
         )
-        cell.value = str(cell.value)
+        # Don't write the string back: Cells of read-only workbooks are immutable.
+        return str(cell.value)
     try:
-        v = unicodedata.normalize("NFC", (cell.value or "").strip())
+        v = normalize_string(cell.value or "")
         return v.replace("\n", ";\t")
     except TypeError:
         return str(v)
@@ -67,7 +69,7 @@ def get_cell_comment(cell: op.cell.Cell) -> str:
 
 
 def normalize_header(row: t.Iterable[op.cell.Cell]) -> t.Iterable[str]:
-    header = [unicodedata.normalize("NFC", (n.value or "").strip()) for n in row]
+    header = [normalize_string(n.value or "") for n in row]
     return header
 
 
@@ -126,18 +128,22 @@ def check_brackets(string, bracket_pairs):
     >>> check_brackets("!(te[xt!)]", b)
     True
     """
+    # Fast path: Most strings contain no delimiters at all.
+    if not any(q in string or (p and p in string) for q, p in bracket_pairs.items()):
+        return True
+    # Stack of closing brackets we are waiting for, innermost last.
     waiting_for = []
     i = 0
     while i < len(string):
-        if waiting_for and string[i:].startswith(waiting_for[0]):
-            i += len(waiting_for.pop(0))
+        if waiting_for and string.startswith(waiting_for[-1], i):
+            i += len(waiting_for.pop())
         else:
             for q, p in bracket_pairs.items():
-                if string[i:].startswith(q):
-                    waiting_for.insert(0, p)
+                if string.startswith(q, i):
+                    waiting_for.append(p)
                     i += len(q)
                     break
-                elif p and string[i:].startswith(p):
+                elif p and string.startswith(p, i):
                     return False
             else:
                 i += 1
@@ -158,30 +164,37 @@ def components_in_brackets(form_string, bracket_pairs):
     >>> components_in_brackets("/aha (exclam. !/ int., also /ah/)",b)
     ['', '/aha (exclam. !/ int., also /ah/)']
 
+    >>> components_in_brackets("aha", b)
+    ['aha']
+
     """
+    # Fast path: Without any opening delimiter, the whole string is one element.
+    if not any(q in form_string for q in bracket_pairs):
+        return [form_string]
+
     elements = []
 
     i = 0
-    remainder = form_string
+    # Start of the element currently being collected
+    start = 0
+    # Stack of closing brackets we are waiting for, innermost last.
     waiting_for = []
-    while i < len(remainder):
-        if waiting_for and remainder[i:].startswith(waiting_for[0]):
-            i += len(waiting_for.pop(0))
+    while i < len(form_string):
+        if waiting_for and form_string.startswith(waiting_for[-1], i):
+            i += len(waiting_for.pop())
             if not any(waiting_for):
-                elements.append(remainder[:i])
-                remainder = remainder[i:]
-                i = 0
+                elements.append(form_string[start:i])
+                start = i
         else:
             for q, p in bracket_pairs.items():
-                if remainder[i:].startswith(q):
+                if form_string.startswith(q, i):
                     if not any(waiting_for):
-                        elements.append(remainder[:i])
-                        remainder = remainder[i:]
-                        i = 0
-                    waiting_for.insert(0, p)
+                        elements.append(form_string[start:i])
+                        start = i
+                    waiting_for.append(p)
                     i += len(q)
                     break
-                # elif p and remainder[i:].startswith(p):
+                # elif p and form_string.startswith(p, i):
                 #     # TODO: @Geroen: do we need this warning? I think this case is better handled in parse_form...
                 #     logger.info(
                 #         f"{context:}In form {form_string}: Encountered mismatched closing delimiter {p}. "
@@ -190,7 +203,8 @@ def components_in_brackets(form_string, bracket_pairs):
             else:
                 i += 1
 
-    return elements + [remainder]
+    elements.append(form_string[start:])
+    return elements
 
 
 class NaiveCellParser:
@@ -308,6 +322,12 @@ class CellParser(NaiveCellParser):
             logger.warning(
                 "Your ‘delimiter pair’ for forms outside delimiters should be the empty string for start and end, but your end string was not empty. I will ignore the end string you specificed."
             )
+        # For each kind of delimited element, in order: its opening string,
+        # the column it goes into, and its pair of delimiters.
+        self.element_dispatch = tuple(
+            (start, self.c[term], (start, self.bracket_pairs[start]))
+            for start, (term, _) in self.element_semantics.items()
+        )
 
         # Colums necessary for word list
         self.cc(short="source", long=("FormTable", "source"), dataset=dataset)
@@ -331,7 +351,7 @@ class CellParser(NaiveCellParser):
             self.c["variants"] = self.c["comment"]
 
         # Other class attributes
-        self.separation_pattern = separation_pattern
+        self.separation_pattern = re.compile(separation_pattern)
         self.variant_separator = variant_separator
         self.add_default_source = add_default_source
 
@@ -398,31 +418,33 @@ class CellParser(NaiveCellParser):
         so that the form parser can try to recover as much as possible or throw
         an exception.
         """
-        raw_split = re.split(self.separation_pattern, values)
+        raw_split = self.separation_pattern.split(values)
         if len(raw_split) <= 1:
             for form in raw_split:
                 yield form
             return
 
-        while len(raw_split) > 1:
-            if check_brackets(raw_split[0], self.bracket_pairs):
-                form = raw_split.pop(0).strip()
+        # raw_split alternates between pieces and the separators between
+        # them. Glue pieces together until their brackets are balanced.
+        form = raw_split[0]
+        for separator, piece in zip(raw_split[1::2], raw_split[2::2]):
+            if check_brackets(form, self.bracket_pairs):
+                form = form.strip()
                 if form:
                     yield form
-                raw_split.pop(0)
+                form = piece
             else:
-                raw_split[:2] = ["".join(raw_split[:2])]
-        if not check_brackets(raw_split[0], self.bracket_pairs):
+                form = "".join((form, separator, piece))
+        if not check_brackets(form, self.bracket_pairs):
             logger.warning(
                 f"{context:}In values {values:}: "
                 "Encountered mismatched closing delimiters. Please check that the "
                 "separation of the cell into multiple entries, for different forms, was correct."
             )
 
-        form = raw_split.pop(0).strip()
+        form = form.strip()
         if form:
             yield form
-        assert not raw_split
 
     def parse_form(
         self,
@@ -439,6 +461,11 @@ class CellParser(NaiveCellParser):
         # not required fields
         c_comment = self.c.get("comment")
         c_variants = self.c.get("variants", c_comment)
+        # Bind per-parser lookups to locals for the element loop below.
+        bracket_pairs = self.bracket_pairs
+        element_semantics = self.element_semantics.items()
+        element_dispatch = self.element_dispatch
+        separators = self.separators
 
         # if string is only whitespaces, there is no form.
         if not form_string.strip():
@@ -454,7 +481,7 @@ class CellParser(NaiveCellParser):
         # '%', see below.
         expect_variant: t.Optional[str] = None
         # Iterate over the delimiter-separated elements of the form.
-        for element in components_in_brackets(form_string, self.bracket_pairs):
+        for element in components_in_brackets(form_string, bracket_pairs):
             element = element.strip()
 
             if not element:
@@ -463,9 +490,9 @@ class CellParser(NaiveCellParser):
             # If the element has mismatched brackets (tends to happen only for
             # the last element, because a mismatched opening bracket means we
             # are still waiting for the closing one), warn.
-            if not check_brackets(element, self.bracket_pairs):
+            if not check_brackets(element, bracket_pairs):
                 try:
-                    delimiter = self.bracket_pairs[element[0]]
+                    delimiter = bracket_pairs[element[0]]
                 except KeyError:
                     delimiter = element[0]
                 raise ValueError(
@@ -474,10 +501,8 @@ class CellParser(NaiveCellParser):
                     f"so the form was not imported."
                 )
             # Check what kind of element we have.
-            for start, (term, transcription) in self.element_semantics.items():
+            for start, field, delimiters in element_dispatch:
                 if element.startswith(start):
-                    field = self.c[term]
-                    delimiters = start, self.bracket_pairs[start]
                     break
             else:
                 # The only thing we expect outside delimiters is the variant
@@ -498,16 +523,16 @@ class CellParser(NaiveCellParser):
                         logger.warning(
                             f"{cell_identifier}In form {form_string}: Element {element} ended with a variant separator, which is not reflected in the output."
                         )
-                    elif any([v in element for v in self.variant_separator]):
+                    elif any(v in element for v in self.variant_separator):
                         logger.info(
-                            f"{cell_identifier}In form {form_string}: Element {element} contained variant separator, but you also specified that elements outside delimiters should be treated as {term}. Please check your output."
+                            f"{cell_identifier}In form {form_string}: Element {element} contained variant separator, but you also specified that elements outside delimiters should be treated as {self.leftovers[0]}. Please check your output."
                         )
 
                     # If there are delimiters for this kind of element, use
                     # those instead.
-                    for start, semantics in self.element_semantics.items():
+                    for start, semantics in element_semantics:
                         if self.leftovers == semantics:
-                            delimiters = start, self.bracket_pairs[start]
+                            delimiters = start, bracket_pairs[start]
                             element = f"{delimiters[0]}{element}{delimiters[1]}"
                             break
                     else:
@@ -526,17 +551,13 @@ class CellParser(NaiveCellParser):
             # comments in variants, if more than one source or comment is
             # provided – We clean this up in self.postprocess_form
 
-            if self.separators[field]:
+            if separators[field]:
                 element = element[len(delimiters[0]) :]
                 if element.endswith(delimiters[1]):
                     element = element[: -len(delimiters[1])]
                 properties.setdefault(field, []).append(element)
             elif field in properties:
-                if (
-                    not expect_variant
-                    and field != c_comment
-                    and not self.separators[field]
-                ):
+                if not expect_variant and field != c_comment and not separators[field]:
                     logger.warning(
                         f"{cell_identifier}In form {form_string}: Element {element} was an unexpected variant for {field}"
                     )
@@ -619,26 +640,30 @@ def alignment_from_braces(text, start=0):
     ([(1, 3)], ['t', 'e', 'x'])
     >>> alignment_from_braces("t e x t")
     ([(1, 4)], ['t', 'e', 'x', 't'])
+    >>> alignment_from_braces("{t e} x {t}")
+    ([(1, 2), (4, 4)], ['t', 'e', 't'])
     """
-    # TODO: Should we warn/error instead?
-    try:
-        before, remainder = text.split("{", 1)
-    except ValueError:
-        before, remainder = "", text
-    try:
-        content, remainder = remainder.split("}", 1)
-    except ValueError:
-        content, remainder = remainder, ""
-    content = content.strip()
-    i = len(before.strip())
-    j = len([s for s in content.split() if s != "-"])
-    slice = (start + i + 1, start + i + j)
-    if "{" in remainder:
-        slices, alignment = alignment_from_braces(remainder, start + i + j)
-        slices.insert(0, slice)
-        return slices, content.split() + alignment
-    else:
-        return [slice], content.split()
+    slices = []
+    alignment = []
+    while True:
+        # TODO: Should we warn/error instead?
+        try:
+            before, remainder = text.split("{", 1)
+        except ValueError:
+            before, remainder = "", text
+        try:
+            content, remainder = remainder.split("}", 1)
+        except ValueError:
+            content, remainder = remainder, ""
+        segments = content.split()
+        i = len(before.strip())
+        j = len([s for s in segments if s != "-"])
+        slices.append((start + i + 1, start + i + j))
+        alignment.extend(segments)
+        if "{" not in remainder:
+            return slices, alignment
+        text = remainder
+        start += i + j
 
 
 class CellParserHyperlink(NaiveCellParser):
@@ -723,7 +748,7 @@ class MawetiCellParser(CellParser):
         # catch procedural comments (e.g. NPC: ...) in #comment and add to
         # corresponding procedural comment.
         for i, subcomment in enumerate(properties.get(self.c["comment"], [])[::-1], 1):
-            if re.match(r"^[A-Z]{2,}:", subcomment):
+            if PROCEDURAL_COMMENT.match(subcomment):
                 properties.setdefault(self.c["procedural_comment"], []).insert(
                     0, subcomment
                 )
@@ -750,21 +775,18 @@ class MawetiCellParser(CellParser):
                     values = property_value.split(separator)
                     first_value = values.pop(0)
                     first_value = first_value.strip()
-                    opening = [
+                    opening = next(
                         start
                         for start, (
                             term,
                             transcription,
                         ) in self.element_semantics.items()
                         if self.c[term] == key
-                    ][0]
+                    )
                     closing = self.bracket_pairs[opening]
                     properties[key] = first_value
                     for value in values:
-                        while value.startswith(" "):
-                            value = value.lstrip(" ")
-                        while value.endswith(" "):
-                            value = value.rstrip(" ")
+                        value = value.strip(" ")
                         if not value[0] == opening:
                             value = opening + value
                         if not value[-1] == closing:
@@ -106,10 +106,6 @@ def copy_dataset(original: Path, target: Path) -> pycldf.Dataset:
         olink = original.parent / link
         tlink = target.parent / link
         shutil.copyfile(olink, tlink)
-    link = dataset.bibpath.name
-    olink = original.parent / link
-    tlink = target.parent / link
-    shutil.copyfile(olink, tlink)
     shutil.copyfile(orig_bibpath, dataset.bibpath)
 
     return dataset
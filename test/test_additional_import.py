@@ -1,5 +1,7 @@
 import logging
 import re
+import typing as t
+import zipfile
 from pathlib import Path
 
 import openpyxl
@@ -34,6 +36,22 @@ def single_import_parameters(request):
     return dataset, target, excel, concept_name
 
 
+@pytest.fixture(scope="module")
+def single_import_workbook():
+    # Parsing a workbook is slow, and the importer only reads from it, so
+    # load each one once for all tests in this module.
+    workbooks: t.Dict[Path, openpyxl.Workbook] = {}
+
+    def load(excel: Path) -> openpyxl.Workbook:
+        if excel not in workbooks:
+            workbooks[excel] = openpyxl.load_workbook(excel, read_only=True)
+        return workbooks[excel]
+
+    yield load
+    for workbook in workbooks.values():
+        workbook.close()
+
+
 def test_concept_file_not_found(caplog):
     copy = copy_metadata(Path(__file__).parent / "data/cldf/minimal/cldf-metadata.json")
     add_single_languages(
@@ -489,9 +507,9 @@ def test_import_multi_languages_in_one_sheet_by_name(caplog, single_import_param
     }
 
 
-def test_multi_sheet_import(single_import_parameters, caplog):
+def test_multi_sheet_import(single_import_parameters, single_import_workbook, caplog):
     dataset, original, excel, concept_name = single_import_parameters
-    excel = openpyxl.load_workbook(excel)
+    excel = single_import_workbook(excel)
     dataset.write(
         ParameterTable=list(dataset["ParameterTable"])
         + [
@@ -543,9 +561,9 @@ def test_multi_sheet_import(single_import_parameters, caplog):
     }
 
 
-def test_add_new_forms_maweti(single_import_parameters):
+def test_add_new_forms_maweti(single_import_parameters, single_import_workbook):
     dataset, original, excel, concept_name = single_import_parameters
-    excel = openpyxl.load_workbook(excel)
+    excel = single_import_workbook(excel)
     c_f_id = dataset["FormTable", "id"].name
     c_f_concept = dataset["FormTable", "parameterReference"].name
     c_c_id = dataset["ParameterTable", "id"].name
@@ -569,6 +587,38 @@ def test_add_new_forms_maweti(single_import_parameters):
     assert new_form[c_f_concept] == ["one_1"]
 
 
+def test_read_only_sheet_with_wrong_dimensions(single_import_parameters, tmp_path):
+    dataset, original, excel, concept_name = single_import_parameters
+    # Claim a much smaller size for each sheet than the data actually has
+    broken = tmp_path / "wrong_dimensions.xlsx"
+    with zipfile.ZipFile(excel) as source, zipfile.ZipFile(broken, "w") as target:
+        for item in source.infolist():
+            data = source.read(item.filename)
+            if item.filename.startswith("xl/worksheets/sheet"):
+                data = re.sub(
+                    rb'<dimension ref="[^"]*"', b'<dimension ref="A1:B2"', data
+                )
+            target.writestr(item, data)
+    c_f_id = dataset["FormTable", "id"].name
+    c_c_id = dataset["ParameterTable", "id"].name
+    c_c_name = dataset["ParameterTable", "name"].name
+    concepts = {c[c_c_name]: c[c_c_id] for c in dataset["ParameterTable"]}
+    old_form_ids = {row[c_f_id] for row in dataset["FormTable"]}
+    workbook = openpyxl.load_workbook(broken, read_only=True)
+    for sheet in workbook.sheetnames:
+        read_single_excel_sheet(
+            dataset=dataset,
+            sheet=workbook[sheet],
+            entries_to_concepts=concepts,
+            concept_column=concept_name,
+        )
+    workbook.close()
+    new_forms = {row[c_f_id] for row in dataset["FormTable"]} - old_form_ids
+    assert len(new_forms) == 1
+    for f in new_forms:
+        assert f.startswith("ache_one")
+
+
 def test_import_error_missing_parameter_column(single_import_parameters):
     dataset, target, excel, concept_name = single_import_parameters
     c_c_id = dataset["ParameterTable", "id"].name
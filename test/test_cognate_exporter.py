@@ -1,7 +1,9 @@
 import re
 import logging
+import tempfile
 from pathlib import Path
 
+import openpyxl
 import pytest
 
 from lexedata import util
@@ -209,17 +211,18 @@ def test_adding_singleton_cognatesets(caplog):
             rows=cogsets, judgements=judgements, forms=forms, languages=languages
         )
     assert re.search("No Status_Column", caplog.text)
+    _, out_filename = tempfile.mkstemp(".xlsx", "cognates")
+    excel_writer.wb.save(filename=out_filename)
+    ws = openpyxl.load_workbook(out_filename).active
 
     # load central concepts from output
     cogset_index = 0
-    for row in excel_writer.ws.iter_rows(min_row=1, max_row=1):
+    for row in ws.iter_rows(min_row=1, max_row=1):
         for cell in row:
             if cell.value == "CogSet":
                 cogset_index = cell.column - 1
     # when accessing the row as a tuple the index is not 1-based as for excel sheets
-    cogset_ids = [
-        row[cogset_index].value for row in excel_writer.ws.iter_rows(min_row=2)
-    ]
+    cogset_ids = [row[cogset_index].value for row in ws.iter_rows(min_row=2)]
     assert cogset_ids == [
         "one1",
         "one1",
@@ -261,14 +264,18 @@ def test_adding_singleton_cognatesets_with_status(caplog):
             rows=cogsets, judgements=judgements, forms=forms, languages=languages
         )
     assert re.search("no Status_Column to write", caplog.text) is None
+    _, out_filename = tempfile.mkstemp(".xlsx", "cognates")
+    excel_writer.wb.save(filename=out_filename)
+    ws = openpyxl.load_workbook(out_filename).active
 
     cogset_index = 0
-    for row in excel_writer.ws.iter_rows(min_row=1, max_row=1):
+    for row in ws.iter_rows(min_row=1, max_row=1):
         for cell in row:
             if cell.value == "Status_Column":
                 cogset_index = cell.column - 1
     # when accessing the row as a tuple the index is not 1-based as for excel sheets
-    status = [row[cogset_index].value for row in excel_writer.ws.iter_rows(min_row=2)]
+    # Empty cells are read back from the file as None
+    status = [row[cogset_index].value or "" for row in ws.iter_rows(min_row=2)]
     assert status == [
         "",
         "",
@@ -139,7 +139,9 @@ def test_roundtrip(cldf_wordlist, working_and_nonworking_bibfile):
     dataset["CognateTable"].write([])
     dataset["CognatesetTable"].write([])
 
-    import_cognates_from_excel(writer.ws, dataset)
+    _, out_filename = tempfile.mkstemp(".xlsx", "cognates")
+    writer.wb.save(filename=out_filename)
+    import_cognates_from_excel(openpyxl.load_workbook(out_filename).active, dataset)
 
     new_judgements = {
         (row[c_formReference], row[c_cogsetReference])
@@ -177,8 +179,9 @@ def test_roundtrip_separator_column(cldf_wordlist, working_and_nonworking_bibfil
     writer.create_excel(
         rows=cogsets, judgements=judgements, forms=forms, languages=languages
     )
+    writer.wb.save(filename=out_filename)
 
-    import_cognates_from_excel(writer.ws, dataset)
+    import_cognates_from_excel(openpyxl.load_workbook(out_filename).active, dataset)
 
     reread_tags = [
         (c[c_id], c["CommaSeparatedTags"]) for c in dataset["CognatesetTable"]
@@ -270,8 +273,10 @@ def test_cell_comments_export():
     writer.create_excel(
         rows=cogsets, judgements=judgements, forms=forms, languages=languages
     )
+    writer.wb.save(filename=out_filename)
+    ws = openpyxl.load_workbook(out_filename).active
 
-    for col in writer.ws.iter_cols():
+    for col in ws.iter_cols():
         pass
     assert (
         col[-1].comment and col[-1].comment.content
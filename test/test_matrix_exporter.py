@@ -1,6 +1,7 @@
 import logging
 from pathlib import Path
 
+import openpyxl
 import pytest
 import tempfile
 
@@ -84,8 +85,10 @@ def test_cell_comments_export():
     E.create_excel(
         rows=parameters, judgements=judgements, forms=forms, languages=languages
     )
+    E.wb.save(filename=out_filename)
+    ws = openpyxl.load_workbook(out_filename).active
 
-    for col in E.ws.iter_cols():
+    for col in ws.iter_cols():
         pass
     assert (
         col[-1].comment and col[-1].comment.content
@@ -97,11 +100,7 @@ def test_cell_comments_export():
 
 def test_toexcel_filtered(cldf_wordlist, working_and_nonworking_bibfile, caplog):
     dataset, url = working_and_nonworking_bibfile(cldf_wordlist)
-    writer = MatrixExcelWriter(
-        dataset=dataset,
-        database_url=str(url),
-    )
-    E = MatrixExcelWriter(dataset, database_url="https://example.org/lexicon/{:}")
+    E = MatrixExcelWriter(dataset, database_url=str(url))
     forms = util.cache_table(dataset)
     languages = sorted(
         util.cache_table(dataset, "LanguageTable").values(), key=lambda x: x["name"]
@@ -120,4 +119,8 @@ def test_toexcel_filtered(cldf_wordlist, working_and_nonworking_bibfile, caplog)
         E.create_excel(
             rows=parameters, judgements=judgements, forms=forms, languages=languages
         )
-    assert len(list(writer.ws.iter_rows())) in {0, 2}
+    _, out_filename = tempfile.mkstemp(".xlsx", "cognates")
+    E.wb.save(filename=out_filename)
+    ws = openpyxl.load_workbook(out_filename).active
+    # Only the header, or the header and the row for 'Woman'
+    assert len(list(ws.iter_rows())) in {1, 2}